@@ -20,6 +20,9 @@ from PyQt5.QtWidgets import QApplication,  QFileDialog, QMainWindow, QVBoxLayout
 from algorithm import run_allocation_algorithm
 from Model import ReaDataModel
 from View import ReaDataView
+import logging
+
+log = logging.getLogger(__name__)
 
 
 class Controller:
@@ -43,6 +46,7 @@ class Controller:
         # Connect project overview
         self.view.add_project_button.clicked.connect(self.view.create_project_subsection)
 
+        self.view.toggle_employee_button.clicked.connect(view.toggle_employee_section)
         self.view.toggle_project_button.clicked.connect(view.toggle_project_section)
 
         self.view.generate_output_button.clicked.connect(self.generate_output)
@@ -58,11 +62,14 @@ class Controller:
     def set_date(self, q_date):
         selected_date = q_date.toString("yyyy-MM-dd")
         if self.setting_start_date:
-            self.view.start_date_input.setText(selected_date)
+            date_input = self.view.start_date_input
             self.setting_start_date = False  # Switch to end date
         else:
-            self.view.end_date_input.setText(selected_date)
+            date_input = self.view.end_date_input
             self.setting_start_date = True  # Reset to start date
+        date_input.setText(selected_date)
+        # Keep the clicked QDate so the view doesn't have to re-parse the text
+        date_input.setProperty("qdate", q_date)
 
     def add_dates(self):
         # Get inputs values
@@ -96,11 +103,15 @@ class Controller:
             all_topics=all_topics
         )
 
+        # Collect the report lines and write them in one print at the end, rather
+        # than one console write per project, employee and day
+        lines = []
+
         # Print some top-level info
-        print("Algorithm finished.")
-        print(f"Iterations used: {result['iteration']}")
+        lines.append("Algorithm finished.")
+        lines.append(f"Iterations used: {result['iteration']}")
         # 1) Show final project costs + target (contractual) side by side
-        print("\nProject Costs (Actual vs. Target):")
+        lines.append("\nProject Costs (Actual vs. Target):")
 
         final_costs = result['final_costs']  # dict of {project_name: final_cost}
 
@@ -116,13 +127,13 @@ class Controller:
             target_cost = proj.grant_contractual
 
             target_cost_float = float(target_cost)
-            print(f"  Project '{proj_name}': Actual={actual_cost:.2f}, Target={target_cost_float:.2f}")
+            lines.append(f"  Project '{proj_name}': Actual={actual_cost:.2f}, Target={target_cost_float:.2f}")
 
         # Print the final allocations
-        print("\nOptimized Hours Allocation:")
+        lines.append("\nOptimized Hours Allocation:")
         allocations = result['allocations']
         for emp_name, emp_data in allocations.items():
-            print(f"Employee: {emp_name}")
+            lines.append(f"Employee: {emp_name}")
             daily_allocations = emp_data["daily_allocations"]
             for date_str, day_data in daily_allocations.items():
                 # day_data is a dict of topic->hours plus 'nonRnD'
@@ -140,7 +151,9 @@ class Controller:
                 # Print line
                 # You can hide nonRnD if it's zero as well,
                 # but here we show it no matter what.
-                print(f"  Date {date_str}: {topics_str}, nonRnD={nonRnD_hours:.2f}")
+                lines.append(f"  Date {date_str}: {topics_str}, nonRnD={nonRnD_hours:.2f}")
+
+        print("\n".join(lines))
 
 
     def read_timesheets(self):
@@ -154,13 +167,15 @@ class Controller:
         self.employees = self.model.extract_data_from_csv(directory, self.date_ranges)
         self.view.create_employee_overview_section(self.employees)
 
-        # Debug/print daily data to the console (optional)
-        for emp in self.employees:
-            print(f"Employee: {emp.employee_name}")
-            # Sort dates so they are printed in chronological order
-            for date_str in sorted(emp.research_hours.keys()):
-                daily_summary = emp.get_daily_summary(date_str)
-                print(f"  Date: {date_str}, Summary: {daily_summary}")
+        # Debug/log daily data (only when debug logging is enabled, so a normal
+        # run doesn't build and print a summary for every employee-day)
+        if log.isEnabledFor(logging.DEBUG):
+            for emp in self.employees:
+                log.debug("Employee: %s", emp.employee_name)
+                # Sort dates so they are logged in chronological order
+                for date_str in sorted(emp.research_hours.keys()):
+                    daily_summary = emp.get_daily_summary(date_str)
+                    log.debug("  Date: %s, Summary: %s", date_str, daily_summary)
 
 
 
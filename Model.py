@@ -19,7 +19,21 @@
 
 import pandas as pd
 import os
+from bisect import bisect_right
 from collections import defaultdict
+from datetime import date, datetime, timedelta
+import logging
+
+log = logging.getLogger(__name__)
+
+
+def _to_date(value):
+    """Normalize a 'YYYY-MM-DD' string, datetime or date to a datetime.date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
 
 class ReaDataModel:
     def __init__(self):
@@ -133,7 +147,7 @@ class ReaDataModel:
     def extract_in_range_columns(self, df, date_ranges):
         # Ensure there is a valid date range
         if not date_ranges:
-            print("No date range has been added yet.")
+            log.warning("No date range has been added yet.")
             return
 
         # Get the last date range added
@@ -147,7 +161,7 @@ class ReaDataModel:
         try:
             dates = pd.to_datetime(df.iloc[2, 4:], format='%m/%d/%Y', errors='coerce')  # Parse dates
         except Exception as e:
-            print(f"Error processing dates in CSV: {str(e)}")
+            log.warning("Error processing dates in CSV: %s", e)
             return
 
         # Exclude the dateless columns of .csv files
@@ -293,21 +307,31 @@ class EmployeeModel:
         self.meeting_hours = defaultdict(float)  # { "2025-01-01": 2.0, "2025-01-02": 3.0 }
         self.nonRnD_hours = defaultdict(float)  # { "2025-01-01": 1.0 }
 
+        # Running totals of research and meeting hours, maintained on every
+        # add so views don't have to re-sum the daily dicts on each render
+        self.total_research_hours = 0.0
+        self.total_meeting_hours = 0.0
+
         # Research topics with hours per day
         self.research_topics = defaultdict(lambda: defaultdict(float))
         # Example: { "2025-01-01": {"Topic A": 3.0, "Topic B": 2.0} }
+        # Every topic seen on any day, kept up to date as topic hours are added
+        self.topic_set = set()
 
-        # Salary levels with validity for each day
-        self.salary_levels = defaultdict(dict)
-        # Example: { "2025-01-01": {"level": "Senior", "amount": 120.0} }
+        # Salary levels as non-overlapping date intervals, sorted by start date
+        self.salary_intervals = []
+        # Example: [(date(2025, 1, 1), date(2025, 6, 30), "Senior", 120.0)]
+        self._salary_starts = []  # start dates of salary_intervals, for bisect
 
     def add_daily_research_hours(self, date, hours):
         """Add research hours for a specific day."""
         self.research_hours[date] += hours
+        self.total_research_hours += hours
 
     def add_daily_meeting_hours(self, date, hours):
         """Add meeting hours for a specific day."""
         self.meeting_hours[date] += hours
+        self.total_meeting_hours += hours
 
     def add_daily_nonRnD_hours(self, date, hours):
         """Add nonRnD hours for a specific day."""
@@ -316,10 +340,48 @@ class EmployeeModel:
     def add_daily_research_topic_hours(self, date, topic, hours):
         """Add hours for a specific research topic on a specific day."""
         self.research_topics[date][topic] += hours
+        self.topic_set.add(topic)
 
     def set_salary_level_for_date(self, date, level, amount):
         """Set the salary level and amount for a specific day."""
-        self.salary_levels[date] = {"level": level, "amount": amount}
+        self.add_salary_interval(date, date, level, amount)
+
+    def add_salary_interval(self, start_date, end_date, level, amount):
+        """
+        Set the salary level and amount for every day from start_date to end_date
+        (inclusive). Days already covered by an earlier interval are overwritten,
+        so the intervals stay non-overlapping.
+        """
+        start = _to_date(start_date)
+        end = _to_date(end_date)
+        if end < start:
+            return
+
+        intervals = []
+        for old_start, old_end, old_level, old_amount in self.salary_intervals:
+            if old_end < start or old_start > end:
+                intervals.append((old_start, old_end, old_level, old_amount))
+                continue
+            # Keep the parts of the old interval outside the new one
+            if old_start < start:
+                intervals.append((old_start, start - timedelta(days=1), old_level, old_amount))
+            if old_end > end:
+                intervals.append((end + timedelta(days=1), old_end, old_level, old_amount))
+        intervals.append((start, end, level, amount))
+        intervals.sort()
+
+        self.salary_intervals = intervals
+        self._salary_starts = [interval[0] for interval in intervals]
+
+    def get_salary_level_for_date(self, date):
+        """Retrieve the salary level and amount for a specific day ({} if none is set)."""
+        day = _to_date(date)
+        i = bisect_right(self._salary_starts, day) - 1
+        if i >= 0:
+            _, end, level, amount = self.salary_intervals[i]
+            if day <= end:
+                return {"level": level, "amount": amount}
+        return {}
 
     def get_daily_summary(self, date):
         """Retrieve a summary of activities for a specific day."""
@@ -328,7 +390,7 @@ class EmployeeModel:
             "meeting_hours": self.meeting_hours[date],
             "nonRnD_hours": self.nonRnD_hours[date],
             "research_topics": dict(self.research_topics[date]),
-            "salary_level": self.salary_levels.get(date, {}),
+            "salary_level": self.get_salary_level_for_date(date),
         }
 
     def __repr__(self):
@@ -338,7 +400,7 @@ class EmployeeModel:
                 f"meeting_hours={dict(self.meeting_hours)}, "
                 f"nonRnD_hours={dict(self.nonRnD_hours)}, "
                 f"research_topics={dict(self.research_topics)}, "
-                f"salary_levels={dict(self.salary_levels)})")
+                f"salary_intervals={self.salary_intervals})")
 
 
 class ProjectModel:
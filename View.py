@@ -18,11 +18,192 @@
 
 from PyQt5.QtWidgets import (
     QMainWindow, QVBoxLayout, QHBoxLayout, QTabWidget, QScrollArea, QLabel, QPushButton,
-    QWidget, QListWidget, QLineEdit, QFileDialog, QCalendarWidget, QCheckBox
+    QWidget, QListWidget, QListWidgetItem, QAbstractItemView, QLineEdit, QCalendarWidget,
+    QTableWidget, QTableWidgetItem, QHeaderView, QFrame, QStackedWidget, QStyledItemDelegate
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QRegularExpression
+from PyQt5.QtGui import QRegularExpressionValidator
 from Model import ProjectModel
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from datetime import date
+from functools import partial
+import logging
+import sys
+
+log = logging.getLogger(__name__)
+
+
+@contextmanager
+def updates_suspended(widget):
+    """Disable repaints of widget and its children for a batch of layout changes."""
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+# All possible research topics, interned once so topic comparisons and
+# hashing are cheap. The "- topic" label texts are shared by every view and
+# subsection.
+ALL_RESEARCH_TOPICS = tuple(sys.intern(t) for t in (
+    "General Info. System / Methodology",
+    "Networks / Distributed Systems",
+    "System / Architecture Integration",
+    "Cogn. Architecture / Hybrid Archi",
+    "Data Processing / Data Mgmt",
+    "Spatial / Temporal Pattrn. Classification",
+    "Training Env. / Artificial Pedagogy",
+    "Visualization / UX",
+    "Multi-Agent Systems",
+    "Sense-Act Cycle / Embedded Systems",
+    "Reasoning / Planning",
+    "Natural Communic. / Autom. Explanation",
+    "Cumulative Learning / Transfer Learn.",
+    "Resource Control / Attention",
+    "Self-Progr. / Seed-Progr. / Cogn. Growth",
+    "Hardware / Robot Hardware",
+    "Modeling / Simulation",
+))
+TOPIC_BULLET_LABELS = {t: f"- {t}" for t in ALL_RESEARCH_TOPICS}
+
+
+# Text accepted by these validators always converts with float() / parse_date:
+# non-negative decimal amounts (empty allowed, independent of the locale's
+# decimal separator) and YYYY-MM-DD dates
+AMOUNT_REGEX = QRegularExpression(r"(\d+(\.\d*)?|\.\d+)?")
+DATE_REGEX = QRegularExpression(r"\d{4}-\d{2}-\d{2}")
+
+
+def set_regex_validator(line_edit, regex):
+    line_edit.setValidator(QRegularExpressionValidator(regex, line_edit))
+
+
+def parse_date(text, q_date=None):
+    """
+    Parse a YYYY-MM-DD string into a datetime.date. If q_date (e.g. from a
+    calendar click) already holds that day, it is converted instead of parsing.
+    """
+    if q_date is not None and q_date.toString("yyyy-MM-dd") == text:
+        return q_date.toPyDate()
+    return date.fromisoformat(text)
+
+
+def parse_amount(text):
+    # Grant amounts are stored as floats; the validator only lets decimals through
+    text = text.strip()
+    return float(text) if text else 0.0
+
+
+def make_separator():
+    """A horizontal line between subsections (no text layout, unlike a dashed QLabel)."""
+    separator = QFrame()
+    separator.setFrameShape(QFrame.HLine)
+    separator.setFrameShadow(QFrame.Sunken)
+    return separator
+
+
+class CollapsibleSection(QWidget):
+    """
+    A toggle button with a content area below it. The content is built by
+    builder(layout) the first time the section is expanded, so collapsed
+    sections cost a single button.
+    """
+    def __init__(self, title, builder):
+        super().__init__()
+        self._builder = builder
+        self._built = False
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.toggle_button = QPushButton(title)
+        self.toggle_button.setCheckable(True)
+        self.toggle_button.toggled.connect(self._on_toggled)
+        layout.addWidget(self.toggle_button)
+
+        self.content = QWidget()
+        self.content.setVisible(False)
+        layout.addWidget(self.content)
+
+    def _on_toggled(self, checked):
+        if checked and not self._built:
+            self._builder(QVBoxLayout(self.content))
+            self._built = True
+        self.content.setVisible(checked)
+
+
+class SalaryLevelDelegate(QStyledItemDelegate):
+    """Validates the amount and date cells of a SalaryLevelTable while they are edited."""
+    def createEditor(self, parent, option, index):
+        editor = super().createEditor(parent, option, index)
+        if isinstance(editor, QLineEdit):
+            set_regex_validator(editor, AMOUNT_REGEX if index.column() == 0 else DATE_REGEX)
+        return editor
+
+
+class SalaryLevelTable(QTableWidget):
+    """
+    The salary levels of one employee, one row per level: amount, start date,
+    end date and an "Apply Salary for Range" button that stores the level on
+    the employee. New rows default to the dates in the given line edits.
+    """
+    def __init__(self, employee, start_date_input, end_date_input):
+        super().__init__(0, 4)
+        self.employee = employee
+        self.start_date_input = start_date_input
+        self.end_date_input = end_date_input
+
+        self.setHorizontalHeaderLabels(
+            ["Salary Amount", "Start Date (YYYY-MM-DD)", "End Date (YYYY-MM-DD)", ""]
+        )
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.setItemDelegate(SalaryLevelDelegate(self))
+
+    def add_salary_level(self):
+        row = self.rowCount()
+        self.insertRow(row)
+        self.setVerticalHeaderItem(row, QTableWidgetItem(f"Salary {row + 1}"))
+
+        # Default the range to the user-specified start and end dates,
+        # carrying over the QDate of a calendar click along with the text
+        self.setItem(row, 0, QTableWidgetItem(""))
+        for column, date_input in ((1, self.start_date_input), (2, self.end_date_input)):
+            date_item = QTableWidgetItem(date_input.text())
+            date_item.setData(Qt.UserRole, date_input.property("qdate"))
+            self.setItem(row, column, date_item)
+
+        # Button to apply the salary to each day in the date range
+        apply_button = QPushButton("Apply Salary for Range")
+        self.setCellWidget(row, 3, apply_button)
+        apply_button.clicked.connect(partial(self.apply_salary_for_range, row))
+
+    def apply_salary_for_range(self, row):
+        amount_text = self.item(row, 0).text().strip()
+        start_item = self.item(row, 1)
+        end_item = self.item(row, 2)
+        start_text = start_item.text().strip()
+        end_text = end_item.text().strip()
+
+        if not start_text or not end_text or not amount_text:
+            print("Please fill in salary, start date, and end date.")
+            return
+
+        # The amount cell only accepts decimals; dates can still be out of range
+        amount_val = float(amount_text)
+        try:
+            start_date = parse_date(start_text, start_item.data(Qt.UserRole))
+            end_date = parse_date(end_text, end_item.data(Qt.UserRole))
+        except ValueError as e:
+            print("Error parsing salary info:", e)
+            return
+
+        # Store the whole range as one interval, e.g. "Salary Level 1, 2, etc."
+        level_label = f"Salary Level {row + 1}"
+        self.employee.add_salary_interval(start_date, end_date, level_label, amount_val)
+
+        log.debug("Applied salary of %s from %s to %s for %s.",
+                  amount_val, start_text, end_text, self.employee.employee_name)
 
 
 class ReaDataView(QMainWindow):
@@ -33,25 +214,7 @@ class ReaDataView(QMainWindow):
 
         # A list of all possible research topics (for demonstration).
         # In practice, one might retrieve this from Model.
-        self.all_research_topics = [
-            "General Info. System / Methodology",
-            "Networks / Distributed Systems",
-            "System / Architecture Integration",
-            "Cogn. Architecture / Hybrid Archi",
-            "Data Processing / Data Mgmt",
-            "Spatial / Temporal Pattrn. Classification",
-            "Training Env. / Artificial Pedagogy",
-            "Visualization / UX",
-            "Multi-Agent Systems",
-            "Sense-Act Cycle / Embedded Systems",
-            "Reasoning / Planning",
-            "Natural Communic. / Autom. Explanation",
-            "Cumulative Learning / Transfer Learn.",
-            "Resource Control / Attention",
-            "Self-Progr. / Seed-Progr. / Cogn. Growth",
-            "Hardware / Robot Hardware",
-            "Modeling / Simulation",
-        ]
+        self.all_research_topics = ALL_RESEARCH_TOPICS
 
         self.projects = []
 
@@ -93,12 +256,14 @@ class ReaDataView(QMainWindow):
         self.start_label = QLabel("Start Date (YYYY-MM-DD):")
         self.main_tab_layout.addWidget(self.start_label)
         self.start_date_input = QLineEdit()
+        set_regex_validator(self.start_date_input, DATE_REGEX)
         self.main_tab_layout.addWidget(self.start_date_input)
 
         # End Date Input
         self.end_label = QLabel("End Date (YYYY-MM-DD):")
         self.main_tab_layout.addWidget(self.end_label)
         self.end_date_input = QLineEdit()
+        set_regex_validator(self.end_date_input, DATE_REGEX)
         self.main_tab_layout.addWidget(self.end_date_input)
 
 
@@ -117,58 +282,66 @@ class ReaDataView(QMainWindow):
         self.toggle_employee_button = QPushButton("Show/Hide Employee Overview")
         self.main_tab_layout.addWidget(self.toggle_employee_button)
 
-        # Add button to toggle visibility
-        self.toggle_project_button = QPushButton("Show/Hide Project Overview")
-        self.main_tab_layout.addWidget(self.toggle_project_button)
+        # Employee Section: a list of employee names next to a stack holding
+        # one page per employee, built the first time that employee is selected
+        self.employee_section_container = QWidget()
+        self.employee_section_layout = QHBoxLayout(self.employee_section_container)
+        self.employee_nav = QListWidget()
+        self.employee_stack = QStackedWidget()
+        self.employee_section_layout.addWidget(self.employee_nav, 1)
+        self.employee_section_layout.addWidget(self.employee_stack, 3)
+        self.employee_nav.currentRowChanged.connect(self.show_employee_page)
+        self.employee_section_container.setVisible(False)  # shown once timesheets are read
+        self.main_tab_layout.addWidget(self.employee_section_container)
 
-        # Add "Add New Project" Button
-        self.add_project_button = QPushButton("Add a New Project")
-        self.main_tab_layout.addWidget(self.add_project_button)
+        self.employees = []
+        self.employee_pages = {}  # row in employee_nav -> built page
 
-        # Projects Section Layout
+        # Projects Section Layout. New project subsections are appended inside
+        # this container, so the widgets below it never have to be moved.
         self.projects_section_container = QWidget()
         self.projects_section_layout = QVBoxLayout(self.projects_section_container)
-        #self.refresh_add_project_button_position()
         self.main_tab_layout.addWidget(self.projects_section_container)
 
+        # Add "Add New Project" Button
+        self.add_project_button = QPushButton("Add a New Project")
+        self.main_tab_layout.addWidget(self.add_project_button)
+
+        # Add button to toggle visibility
+        self.toggle_project_button = QPushButton("Show/Hide Project Overview")
+        self.main_tab_layout.addWidget(self.toggle_project_button)
+
         # Generate Output via the Algorithm:
         self.generate_output_button = QPushButton("Generate Output")
         self.main_tab_layout.addWidget(self.generate_output_button)
 
     def create_employee_overview_section(self, employees):
-        # Create a container for the entire section
-        self.employee_section_container = QWidget()
-        self.employee_section_layout = QVBoxLayout(self.employee_section_container)
-
-        for employee in employees:
-            # Create a container widget for each employee
-            employee_container = QWidget()
-            employee_layout = QVBoxLayout(employee_container)
-            employee_container.setLayout(employee_layout)
-
-            # Call create_employee_overview_subsection with the specific layout
-            self.create_employee_overview_subsection(employee, employee_layout)
-
-            # Add a separator label or visual separator if desired
-            separator = QLabel("-------------------------------------------------")
-            separator.setAlignment(Qt.AlignCenter)
-
-            #
-            self.employee_section_layout.addWidget(employee_container)
-            self.employee_section_layout.addWidget(separator)
-
-        # Add the entire section container to the main layout
-        self.main_tab_layout.addWidget(self.employee_section_container)
-        self.refresh_section_positions()
-
-
-        def toggle_employee_section():
-            if self.employee_section_container.isVisible():
-                self.employee_section_container.setVisible(False)
-            else:
-                self.employee_section_container.setVisible(True)
-
-        self.toggle_employee_button.clicked.connect(toggle_employee_section)
+        with updates_suspended(self.employee_section_container):
+            # Drop the pages of a previous import
+            self.employees = []
+            self.employee_nav.clear()
+            for page in self.employee_pages.values():
+                self.employee_stack.removeWidget(page)
+                page.deleteLater()
+            self.employee_pages = {}
+
+            # Only the names are added up front; show the first employee
+            self.employees = list(employees)
+            self.employee_nav.addItems([f"{employee.employee_name}" for employee in self.employees])
+            if self.employees:
+                self.employee_nav.setCurrentRow(0)
+            self.employee_section_container.setVisible(True)
+
+    def show_employee_page(self, row):
+        if row < 0 or row >= len(self.employees):
+            return
+        page = self.employee_pages.get(row)
+        if page is None:
+            page = QWidget()
+            self.create_employee_overview_subsection(self.employees[row], QVBoxLayout(page))
+            self.employee_stack.addWidget(page)
+            self.employee_pages[row] = page
+        self.employee_stack.setCurrentWidget(page)
 
     def create_employee_overview_subsection(self, employee, layout):
         name_label = QLabel("Name")
@@ -179,13 +352,13 @@ class ReaDataView(QMainWindow):
 
         rh_label = QLabel("Total research hours")
         rh_field = QLineEdit()
-        rh_field.setText(str(sum(employee.research_hours.values())))
+        rh_field.setText(f"{employee.total_research_hours}")
         layout.addWidget(rh_label)
         layout.addWidget(rh_field)
 
         mh_label = QLabel("Total meeting hours")
         mh_field = QLineEdit()
-        mh_field.setText(str(sum(employee.meeting_hours.values())))
+        mh_field.setText(f"{employee.total_meeting_hours}")
         layout.addWidget(mh_label)
         layout.addWidget(mh_field)
 
@@ -193,111 +366,30 @@ class ReaDataView(QMainWindow):
         research_topics_label = QLabel("Research Topics")
         layout.addWidget(research_topics_label)
 
-        # Show only the topics (no hours)
-        #    We'll collect all topic names from all days in this time period
-        all_topics = set()  # to avoid duplicates
-        for date_str, daily_topics in employee.research_topics.items():
-            all_topics.update(daily_topics.keys())
+        # Show only the topics (no hours); the employee already tracks the
+        # distinct topic names from all days in this time period
+        all_topics = employee.topic_set
 
-        # Only display topic names if any exist
+        # Only display topic names if any exist; the labels are built the
+        # first time the topics are expanded
         if all_topics:
-            research_topics_label = QLabel("Research Topics (without hours):")
-            layout.addWidget(research_topics_label)
-
-            for topic in sorted(all_topics):
-                topic_label = QLabel(f"- {topic}")
-                layout.addWidget(topic_label)
-
-        # Add a container for dynamic salary levels
-        salary_levels_container = QVBoxLayout()
-        layout.addLayout(salary_levels_container)
-
-        # Initialize salary level count
-        salary_level_count = 0  # Counter for salary levels
-
-        def add_salary_level():
-            nonlocal salary_level_count
-            salary_level_count += 1  # Increment the salary level count
-            # Create a horizontal layout for the salary level inputs
-            salary_level_layout = QHBoxLayout()
-
-            salary_amount = QLabel(f"Salary {salary_level_count}")
-            salary_amount_input = QLineEdit()
-            salary_amount_input.setPlaceholderText("Enter the salary amount")
-            # salary_amount_input.textChanged.connect(lambda text: setattr(employee, 'salary_level', text))
-            salary_level_layout.addWidget(salary_amount)
-            salary_level_layout.addWidget(salary_amount_input)
-
-            # Set the entered salary level
-            #employee.salary_level = salary_amount_input
-            #name_input.textChanged.connect(lambda text: setattr(project, 'name', text))
-
-            # Add start and end date inputs
-            salary_start_label = QLabel("Start Date (YYYY-MM-DD):")
-            salary_start_input = QLineEdit()
-            salary_start_input.setPlaceholderText("Enter start date")
-
-            # NEW: Default to the user-specified start date
-            salary_start_input.setText(self.start_date_input.text())
-
-            #salary_amount_input.setText(self.start_date_input.toString("yyyy-MM-dd"))
-            salary_level_layout.addWidget(salary_start_label)
-            salary_level_layout.addWidget(salary_start_input)
-
-            salary_end_label = QLabel("End Date (YYYY-MM-DD):")
-            salary_end_input = QLineEdit()
-            salary_end_input.setPlaceholderText("Enter end date")
-            #salary_end_input.setText(self.end_date_input.toString("yyyy-MM-dd"))
-
-            # NEW: Default to the user-specified end date
-            salary_end_input.setText(self.end_date_input.text())
-
-            salary_level_layout.addWidget(salary_end_label)
-            salary_level_layout.addWidget(salary_end_input)
-
-            # Add the completed layout to the container
-            salary_levels_container.addLayout(salary_level_layout)
-
-            # Button to apply the salary to each day in the date range
-            apply_button = QPushButton("Apply Salary for Range")
-            salary_level_layout.addWidget(apply_button)
-
-            # Define how to apply the salary
-            def apply_salary_for_range():
-                start_text = salary_start_input.text().strip()
-                end_text = salary_end_input.text().strip()
-                amount_text = salary_amount_input.text().strip()
-
-                if not start_text or not end_text or not amount_text:
-                    print("Please fill in salary, start date, and end date.")
-                    return
-
-                try:
-                    start_date = datetime.strptime(start_text, "%Y-%m-%d")
-                    end_date = datetime.strptime(end_text, "%Y-%m-%d")
-                    amount_val = float(amount_text)
-                except Exception as e:
-                    print("Error parsing salary info:", e)
-                    return
-
-                # Iterate through the date range
-                current_date = start_date
-                while current_date <= end_date:
-                    day_str = current_date.strftime("%Y-%m-%d")
-                    # e.g., we label it "Salary Level 1, 2, etc."
-                    level_label = f"Salary Level {salary_level_count}"
-                    employee.set_salary_level_for_date(day_str, level_label, amount_val)
-                    current_date += timedelta(days=1)
-
-                print(f"Applied salary of {amount_val} from {start_text} to {end_text} for {employee.employee_name}.")
-
-            apply_button.clicked.connect(apply_salary_for_range)
-
-        add_salary_level()
+            def build_topic_labels(topics_layout):
+                for topic in sorted(all_topics):
+                    topic_label = QLabel(TOPIC_BULLET_LABELS.get(topic, f"- {topic}"))
+                    topics_layout.addWidget(topic_label)
+
+            layout.addWidget(CollapsibleSection("Research Topics (without hours)", build_topic_labels))
+
+        # Add a table for dynamic salary levels: one row per level instead of
+        # a nested horizontal layout of labels and line edits per level
+        salary_levels_table = SalaryLevelTable(employee, self.start_date_input, self.end_date_input)
+        layout.addWidget(salary_levels_table)
+
+        salary_levels_table.add_salary_level()
         # Add the "Add Salary Level" button
         add_salary_button = QPushButton("Add Salary Level")
         layout.addWidget(add_salary_button)
-        add_salary_button.clicked.connect(add_salary_level)
+        add_salary_button.clicked.connect(salary_levels_table.add_salary_level)
 
 
 
@@ -306,15 +398,45 @@ class ReaDataView(QMainWindow):
         project = ProjectModel()
         self.projects.append(project)
 
+        project_subsection = self._build_project_subsection(project)
+
+        # Add a visual separator between projects
+        separator_project = make_separator()
+
+        with updates_suspended(self.scroll_area_widget):
+            # Add the subsection to the main projects section layout
+            self.projects_section_layout.addWidget(project_subsection)
+            self.projects_section_layout.addWidget(separator_project)
+
+    def _bind_text(self, line_edit, project, attr, cast=str):
+        # One slot per field, run once per edit (Enter or focus out) rather
+        # than on every keystroke
+        line_edit.editingFinished.connect(partial(self._on_text_edited, line_edit, project, attr, cast))
+
+    def _on_text_edited(self, line_edit, project, attr, cast):
+        setattr(project, attr, cast(line_edit.text()))
+
+    def _build_project_subsection(self, project):
+        """
+        Build the input widgets for a project, pre-filled from its current
+        values, and return the subsection widget. A fresh ProjectModel only
+        has defaults, so its fields show their placeholders.
+        """
         # Create a subsection (container + layout)
         project_subsection = QWidget()
         project_layout = QVBoxLayout(project_subsection)
 
+        def prefill(line_edit, value):
+            # Defaults (empty text or 0) keep the placeholder visible
+            if value:
+                line_edit.setText(f"{value}")
+
         # Project Name
         name_label = QLabel("Project Name:")
         name_input = QLineEdit()
         name_input.setPlaceholderText("Enter project name")
-        name_input.textChanged.connect(lambda text: setattr(project, 'name', text))
+        prefill(name_input, project.name)
+        self._bind_text(name_input, project, 'name')
         project_layout.addWidget(name_label)
         project_layout.addWidget(name_input)
 
@@ -322,7 +444,8 @@ class ReaDataView(QMainWindow):
         funding_label = QLabel("Funding Agency Name:")
         funding_input = QLineEdit()
         funding_input.setPlaceholderText("Enter funding agency name")
-        funding_input.textChanged.connect(lambda text: setattr(project, 'funding_agency', text))
+        prefill(funding_input, project.funding_agency)
+        self._bind_text(funding_input, project, 'funding_agency')
         project_layout.addWidget(funding_label)
         project_layout.addWidget(funding_input)
 
@@ -332,15 +455,21 @@ class ReaDataView(QMainWindow):
         min_label = QLabel("Min:")
         min_input = QLineEdit()
         min_input.setPlaceholderText("Enter min grant")
-        min_input.textChanged.connect(lambda text: setattr(project, 'grant_min', text))
+        prefill(min_input, project.grant_min)
+        set_regex_validator(min_input, AMOUNT_REGEX)
+        self._bind_text(min_input, project, 'grant_min', cast=parse_amount)
         max_label = QLabel("Max:")
         max_input = QLineEdit()
         max_input.setPlaceholderText("Enter max grant")
-        max_input.textChanged.connect(lambda text: setattr(project, 'grant_max', text))
+        prefill(max_input, project.grant_max)
+        set_regex_validator(max_input, AMOUNT_REGEX)
+        self._bind_text(max_input, project, 'grant_max', cast=parse_amount)
         contractual_label = QLabel("Contractual:")
         contractual_input = QLineEdit()
         contractual_input.setPlaceholderText("Enter contractual grant")
-        contractual_input.textChanged.connect(lambda text: setattr(project, 'grant_contractual', text))
+        prefill(contractual_input, project.grant_contractual)
+        set_regex_validator(contractual_input, AMOUNT_REGEX)
+        self._bind_text(contractual_input, project, 'grant_contractual', cast=parse_amount)
         grant_layout.addWidget(min_label)
         grant_layout.addWidget(min_input)
         grant_layout.addWidget(max_label)
@@ -355,11 +484,13 @@ class ReaDataView(QMainWindow):
         start_label = QLabel("Start Date:")
         start_input = QLineEdit()
         start_input.setPlaceholderText("Enter start date")
-        start_input.textChanged.connect(lambda text: setattr(project, 'funding_start', text))
+        prefill(start_input, project.funding_start)
+        self._bind_text(start_input, project, 'funding_start')
         end_label = QLabel("End Date:")
         end_input = QLineEdit()
         end_input.setPlaceholderText("Enter end date")
-        end_input.textChanged.connect(lambda text: setattr(project, 'funding_end', text))
+        prefill(end_input, project.funding_end)
+        self._bind_text(end_input, project, 'funding_end')
         funding_period_layout.addWidget(start_label)
         funding_period_layout.addWidget(start_input)
         funding_period_layout.addWidget(end_label)
@@ -370,68 +501,45 @@ class ReaDataView(QMainWindow):
         topics_label = QLabel("Select Research Topics:")
         project_layout.addWidget(topics_label)
 
-        # We'll store the checkboxes in a local list or dictionary
-        # so we can refer to them when the user clicks "Apply Topics"
-        topic_checkboxes = []
+        # One checkable list widget holds all topics, so we can read the
+        # check states back when the user clicks "Apply Topics"
+        topics_list = QListWidget()
+        topics_list.setSelectionMode(QAbstractItemView.NoSelection)
+        selected_topics = set(project.research_topics)
         for topic in self.all_research_topics:
-            checkbox = QCheckBox(topic)
-            project_layout.addWidget(checkbox)
-            topic_checkboxes.append(checkbox)
+            item = QListWidgetItem(topic)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if topic in selected_topics else Qt.Unchecked)
+            topics_list.addItem(item)
+        project_layout.addWidget(topics_list)
 
         #   Button to apply the checked topics to the project
         apply_topics_button = QPushButton("Apply Topics")
 
         def apply_topics():
-            # Clear the project's research_topics first if you want a fresh set each time
-            # or else you can keep them and only add new ones.
+            # Replace the project's research_topics with the checked topics in
+            # one pass. The list rows follow self.all_research_topics, so the
+            # topic names are taken from there.
             project.research_topics.clear()
+            for i, topic in enumerate(self.all_research_topics):
+                if topics_list.item(i).checkState() == Qt.Checked:
+                    project.add_research_topic(topic)
 
-            # Add each checked topic to the project
-            for cb in topic_checkboxes:
-                if cb.isChecked():
-                    project.add_research_topic(cb.text())
-
-            print(f"Project '{project.name}' Topics Updated:", project.research_topics)
+            log.debug("Project '%s' Topics Updated: %s", project.name, project.research_topics)
 
         apply_topics_button.clicked.connect(apply_topics)
         project_layout.addWidget(apply_topics_button)
 
-        # Add the subsection to the main projects section layout
-        self.projects_section_layout.addWidget(project_subsection)
-
-        # Add a separator label or visual separator if desired
-        separator_project = QLabel("-------------------------------------------------")
-        separator_project.setAlignment(Qt.AlignCenter)
-
-        #
-        self.projects_section_layout.addWidget(separator_project)
+        return project_subsection
 
-        # Refresh the button and sections positions
-        self.refresh_section_positions()
+    def toggle_employee_section(self):
+        if self.employee_section_container.isVisible():
+            self.employee_section_container.setVisible(False)
+        else:
+            self.employee_section_container.setVisible(True)
 
     def toggle_project_section(self):
         if self.projects_section_container.isVisible():
             self.projects_section_container.setVisible(False)
         else:
             self.projects_section_container.setVisible(True)
-
-
-    def refresh_add_project_button_position(self):
-        # Remove the button from its current position
-        self.projects_section_layout.removeWidget(self.add_project_button)
-
-        # Add the button back at the bottom
-        self.projects_section_layout.addWidget(self.add_project_button)
-
-    def refresh_section_positions(self):
-        # Remove the projects section and button
-        self.main_tab_layout.removeWidget(self.projects_section_container)
-        self.main_tab_layout.removeWidget(self.add_project_button)
-        self.main_tab_layout.removeWidget(self.toggle_project_button)
-        self.main_tab_layout.removeWidget(self.generate_output_button)
-
-        # Add the projects section and button at the end
-        self.main_tab_layout.addWidget(self.projects_section_container)
-        self.main_tab_layout.addWidget(self.add_project_button)
-        self.main_tab_layout.addWidget(self.toggle_project_button)
-        self.main_tab_layout.addWidget(self.generate_output_button)
\ No newline at end of file
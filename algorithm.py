@@ -17,7 +17,30 @@
 # -----------------------------------------------------------------------------
 
 import numpy as np
-from datetime import datetime, timedelta
+import pandas as pd
+from datetime import date
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def _parse_date_range(start_date, end_date):
+    """
+    Parse a "YYYY-MM-DD" start/end pair and format every day in between in one
+    vectorized call. Returns (first day as a date, tuple of day strings,
+    dict of day string -> position). Cached, since the same range is usually
+    allocated many times in a session.
+    """
+    dt_start = date.fromisoformat(start_date)
+    dt_end = date.fromisoformat(end_date)
+    date_list = tuple(pd.date_range(dt_start, dt_end, freq="D").strftime("%Y-%m-%d"))
+    day_index = {d_str: d_i for d_i, d_str in enumerate(date_list)}
+    return dt_start, date_list, day_index
+
+
+@lru_cache(maxsize=32)
+def _build_topic_index(all_topics):
+    """Map each topic name in the all_topics tuple to its index. Cached per topic tuple."""
+    return {topic: i for i, topic in enumerate(all_topics)}
 
 
 def run_allocation_algorithm(employees, projects, start_date, end_date, all_topics):
@@ -33,36 +56,28 @@ def run_allocation_algorithm(employees, projects, start_date, end_date, all_topi
     :return: A data structure (e.g., dict) with the optimized hours results
     """
 
-    # Parse the date range
-    dt_start = datetime.strptime(start_date, "%Y-%m-%d")
-    dt_end = datetime.strptime(end_date, "%Y-%m-%d")
-    date_list = []
-    current = dt_start
-    while current <= dt_end:
-        date_list.append(current.strftime("%Y-%m-%d"))
-        current += timedelta(days=1)
+    # Parse the date range and list every day in it
+    dt_start, date_list, day_index = _parse_date_range(start_date, end_date)
     num_days = len(date_list)
 
     # Gather employees data
     num_employees = len(employees)
 
     # Build a map of all topics -> index, so we can store them in a matrix
-    #    (We also add 1 slot for nonRnD hours at the end.)
-    topic_to_index = {topic: i for i, topic in enumerate(all_topics)}
+    #    (nonRnD hours are kept in their own array, see optimized_nonRnD.)
+    topic_to_index = _build_topic_index(tuple(all_topics))
     num_topics = len(all_topics)
 
-    # Build a matrix of daily salaries for each employee
-    #    We'll flatten them as [emp0_day0, emp0_day1, ..., emp1_day0, emp1_day1, ...]
-    salaries = []
+    # Build a matrix of daily salaries for each employee [num_employees, num_days]
+    #    Each salary interval fills its slice of days in one assignment; days
+    #    without a salary stay 0.0.
+    salary_matrix = np.zeros((num_employees, num_days))
     for emp_i, emp in enumerate(employees):
-        for day_str in date_list:
-            # If you stored daily salary in employee.salary_levels[day_str], parse it
-            # or default to some value
-            day_salary_info = emp.salary_levels.get(day_str, {})
-            day_salary_amount = day_salary_info.get("amount", 0.0)
-            salaries.append(day_salary_amount)
-
-    salaries = np.array(salaries)  # shape: (num_employees * num_days,)
+        for interval_start, interval_end, _, amount in emp.salary_intervals:
+            day_from = max((interval_start - dt_start).days, 0)
+            day_to = min((interval_end - dt_start).days + 1, num_days)
+            if day_from < day_to:
+                salary_matrix[emp_i, day_from:day_to] = amount
 
     # Build project -> contractual target map
     target_costs = {}
@@ -81,32 +96,59 @@ def run_allocation_algorithm(employees, projects, start_date, end_date, all_topi
                 topics_index_list.append(topic_to_index[t_name])
         project_topics[proj_name] = topics_index_list
 
-    # Build the research_hours matrix [num_employees, num_days]
+    # Index projects by position from here on: project_names[p_i] with its target in
+    #    target_costs_arr[p_i] and its topic indices in project_topic_list[p_i]
+    project_names = list(project_topics)
+    num_projects = len(project_names)
+    target_costs_arr = np.array([target_costs[p_name] for p_name in project_names], dtype=float)
+    project_topic_list = [project_topics[p_name] for p_name in project_names]
+
+    # Build the research_hours matrix [num_employees, num_days] and the eligibility
+    #    mask [num_employees, num_days, num_topics] (True where the employee actually
+    #    logged that topic on that day).
     #    The user’s daily research hours for each day are in employee.research_hours[day_str].
+    #    Both are filled from each employee's own entries, placed by day_index, so days
+    #    outside the range are skipped and days without entries stay zero/False.
     research_hours_array = np.zeros((num_employees, num_days), dtype=float)
+    eligible = np.zeros((num_employees, num_days, num_topics), dtype=bool)
     for emp_i, emp in enumerate(employees):
-        for d_i, d_str in enumerate(date_list):
-            research_hours_array[emp_i, d_i] = emp.research_hours[d_str]
+        for d_str, hours in emp.research_hours.items():
+            d_i = day_index.get(d_str)
+            if d_i is not None:
+                research_hours_array[emp_i, d_i] = hours
+
+        for d_str, day_topics in emp.research_topics.items():
+            d_i = day_index.get(d_str)
+            if d_i is not None:
+                for t_name in day_topics:
+                    t_idx = topic_to_index.get(t_name)
+                    if t_idx is not None:
+                        eligible[emp_i, d_i, t_idx] = True
+
+    # nonRnD hours per cell may not exceed 25% of the logged research hours
+    max_nonRnD_array = 0.25 * research_hours_array
 
     # Initialize the “optimized_hours” structure
-    #    shape: (num_employees, num_days, num_topics+1)  # +1 for nonRnD hours
-    optimized_hours = np.zeros((num_employees, num_days, num_topics + 1), dtype=float)
+    #    shape: (num_employees, num_days, num_topics)
+    #    nonRnD hours are kept in their own (num_employees, num_days) array, so the
+    #    topic sums and rescales work on contiguous rows
+    optimized_hours = np.zeros((num_employees, num_days, num_topics), dtype=float)
+    optimized_nonRnD = np.zeros((num_employees, num_days), dtype=float)
+
+    # Project -> topic weights [num_projects, num_topics]: how many times each
+    #    topic counts toward the project's cost. nonRnD hours count toward every project.
+    project_topic_mask = np.zeros((num_projects, num_topics), dtype=float)
+    for p_i in range(num_projects):
+        np.add.at(project_topic_mask[p_i], project_topic_list[p_i], 1.0)
 
     # ------------------------------
     # Helper function to compute project costs
     # ------------------------------
-    def compute_project_costs(hours):
-        costs = {p_name: 0.0 for p_name in project_topics}
-        for p_name, topic_indices in project_topics.items():
-            for day_i in range(num_days):
-                for emp_i in range(num_employees):
-                    # Sum contributions for topics
-                    for t_idx in topic_indices:
-                        costs[p_name] += hours[emp_i, day_i, t_idx] * salaries[emp_i * num_days + day_i]
-
-                    # Add nonRnD hours
-                    costs[p_name] += hours[emp_i, day_i, -1] * salaries[emp_i * num_days + day_i]
-        return costs
+    def compute_project_costs(hours, nonRnD):
+        # Salary-weighted hours per topic, summed over employees and days
+        topic_costs = np.einsum('ed,edt->t', salary_matrix, hours)
+        nonRnD_cost = np.einsum('ed,ed->', salary_matrix, nonRnD)
+        return project_topic_mask @ topic_costs + nonRnD_cost
 
     # Parameters
     hour_limits = np.array([8] * num_employees * num_days)  # 8-hour daily limit. Is this affecting anything?
@@ -114,108 +156,137 @@ def run_allocation_algorithm(employees, projects, start_date, end_date, all_topi
     penalty_factor = 0.001
     max_iterations = 50
 
+    # If nobody logged research hours in the range, every cell is rescaled back to
+    #    zero hours, so all costs stay 0: run no passes and report the result directly
+    any_research = research_hours_array.any()
+    if not any_research:
+        project_costs = np.zeros(num_projects)
+        iteration = 0 if np.all(project_costs >= target_costs_arr) else max_iterations - 1
+
     # ------------------------------
     # Iterative adjustment
     # ------------------------------
-    for iteration in range(max_iterations):
-        project_costs_dict = compute_project_costs(optimized_hours)
+    for iteration in range(max_iterations if any_research else 0):
+        # project_costs always holds the costs of the current optimized_hours: it is
+        #    computed exactly here and then updated by each change to one (emp, day)
+        #    cell, instead of being recomputed over all employees and days.
+        #    costs_seen holds the costs as of the last re-check, which is what each
+        #    project's deficit is based on.
+        project_costs = compute_project_costs(optimized_hours, optimized_nonRnD)
+        costs_seen = project_costs.copy()
+        hours_at_start = optimized_hours.copy()
+        nonRnD_at_start = optimized_nonRnD.copy()
 
         for emp_i in range(num_employees):
             for day_i in range(num_days):
-                for p_name, topic_indices in project_topics.items():
+                emp_salary = salary_matrix[emp_i, day_i]
+                #### We scale the learning rate inversely with salary
+                #     so high-salary employees adjust more slowly.
+                ### "scaled_lr" is smaller for big salaries
+                scaled_lr = learning_rate / (1.0 + (emp_salary / 1500.0))
+                # Topics the employee actually has for this day
+                cell_eligible = eligible[emp_i, day_i]
+                # View of this (emp, day) row of hours; updating it updates optimized_hours
+                cell_hours = optimized_hours[emp_i, day_i]
+
+                for p_i in range(num_projects):
                     # Re-check cost each time we handle a project in this day
-                    cost_now = project_costs_dict[p_name]
-                    target = target_costs[p_name]
+                    cost_now = costs_seen[p_i]
+                    target = target_costs_arr[p_i]
                     deficit = max(0, target - cost_now)
 
-                    for t_idx in topic_indices:
-                        # Convert t_idx back to a topic name
-                        topic_name = all_topics[t_idx]
-                        # Check if the employee actually has this topic for this day
-                        d_str = date_list[day_i]
-                        if topic_name in employees[emp_i].research_topics[d_str]:
-                            #### We scale the learning rate inversely with salary
-                            #     so high-salary employees adjust more slowly.
-                            base_lr = learning_rate
-                            emp_salary = salaries[emp_i * num_days + day_i]
-
-                            ### "scaled_lr" is smaller for big salaries
-                            scaled_lr = base_lr / (1.0 + (emp_salary / 1500.0))
-
-                            optimized_hours[emp_i, day_i, t_idx] += (scaled_lr * emp_salary * deficit)
+                    # Step every topic of this project that the employee has for this day
+                    #    (the mask row is 0 for topics outside the project)
+                    topic_step = (scaled_lr * emp_salary * deficit) * (project_topic_mask[p_i] * cell_eligible)
+                    cell_hours += topic_step
 
-                    ####: After adjusting topics for this project, re-compute costs
-                    project_costs_dict = compute_project_costs(optimized_hours)
+                    ####: After adjusting topics for this project, re-check costs
+                    project_costs += emp_salary * (project_topic_mask @ topic_step)
+                    costs_seen[:] = project_costs
 
                     # Adjust nonRnD hours
-                    total_research = np.sum(optimized_hours[emp_i, day_i, :num_topics])
+                    nonRnD_before = optimized_nonRnD[emp_i, day_i]
+                    total_research = np.sum(cell_hours)
                     ### Only allocate nonRnD if total_research > 0
                     if total_research > 0:
                         if cost_now > target:
                             diff = cost_now - target
-                            new_mgmt = optimized_hours[emp_i, day_i, -1] - penalty_factor * diff * salaries[
-                                emp_i * num_days + day_i]
-                            optimized_hours[emp_i, day_i, -1] = max(0, new_mgmt)
+                            new_mgmt = optimized_nonRnD[emp_i, day_i] - penalty_factor * diff * emp_salary
+                            optimized_nonRnD[emp_i, day_i] = max(0, new_mgmt)
                         elif cost_now < target:
                             diff = target - cost_now
-                            optimized_hours[emp_i, day_i, -1] += learning_rate * diff
+                            optimized_nonRnD[emp_i, day_i] += learning_rate * diff
                     else:
                         # If there's no research, no nonRnD hours
-                        optimized_hours[emp_i, day_i, -1] = 0.0
+                        optimized_nonRnD[emp_i, day_i] = 0.0
+                    # nonRnD hours count toward every project
+                    project_costs += emp_salary * (optimized_nonRnD[emp_i, day_i] - nonRnD_before)
 
                 # Ensure nonRnD ≤ 25% of total research
-                max_mgmt = 0.25 * research_hours_array[emp_i, day_i]
-                if optimized_hours[emp_i, day_i, -1] > max_mgmt:
-                    optimized_hours[emp_i, day_i, -1] = max_mgmt
+                max_mgmt = max_nonRnD_array[emp_i, day_i]
+                if optimized_nonRnD[emp_i, day_i] > max_mgmt:
+                    project_costs += emp_salary * (max_mgmt - optimized_nonRnD[emp_i, day_i])
+                    optimized_nonRnD[emp_i, day_i] = max_mgmt
+
+                hours_before = cell_hours.copy()
 
                 # Adjust to match the user’s total research hours exactly
                 if not np.isclose(total_research, research_hours_array[emp_i, day_i]):
                     diff = research_hours_array[emp_i, day_i] - total_research
                     if total_research > 0:
                         # Scale proportionally
-                        optimized_hours[emp_i, day_i, :num_topics] += (diff / total_research) * optimized_hours[emp_i,
-                                                                                                day_i, :num_topics]
+                        cell_hours += (diff / total_research) * cell_hours
                     else:
                         # Evenly distribute if no research yet
-                        optimized_hours[emp_i, day_i, :num_topics] += diff / num_topics
+                        cell_hours += diff / num_topics
+
+                project_costs += emp_salary * (
+                    project_topic_mask @ (cell_hours - hours_before))
 
         # Recompute costs after the adjustments
-        project_costs_dict = compute_project_costs(optimized_hours)
+        project_costs = compute_project_costs(optimized_hours, optimized_nonRnD)
         # Check if all targets are met
-        if all(project_costs_dict[p_name] >= target_costs[p_name] for p_name in project_topics):
+        if np.all(project_costs >= target_costs_arr):
             break
+        # A pass that changed no hours will change none on any later pass either, so
+        #    stop with the same result (and iteration count) as running them all
+        if np.array_equal(optimized_hours, hours_at_start) and np.array_equal(optimized_nonRnD, nonRnD_at_start):
+            iteration = max_iterations - 1
+            break
+
+    project_costs_dict = dict(zip(project_names, project_costs.tolist()))
 
     #    Save the results back into the EmployeeModel objects
     #    For each employee/day/topic, store the final optimized hours
-    for emp_i, emp in enumerate(employees):
-        for d_i, d_str in enumerate(date_list):
-            # Overwrite or store in a new structure. Let's store in a new field: emp.optimized_hours[date_str][topic]
-            if not hasattr(emp, "optimized_hours"):
-                emp.optimized_hours = {}  # { date_str: { topic_name: hours, ..., 'nonRnD': x } }
+    #    (converted to Python floats in one tolist() call per array)
+    hours_rows = optimized_hours.tolist()
+    nonRnD_rows = optimized_nonRnD.tolist()
+    for emp, emp_rows, emp_nonRnD in zip(employees, hours_rows, nonRnD_rows):
+        # Overwrite or store in a new structure. Let's store in a new field: emp.optimized_hours[date_str][topic]
+        if not hasattr(emp, "optimized_hours"):
+            emp.optimized_hours = {}  # { date_str: { topic_name: hours, ..., 'nonRnD': x } }
 
-            if d_str not in emp.optimized_hours:
-                emp.optimized_hours[d_str] = {}
+        for d_str, day_row, day_nonRnD in zip(date_list, emp_rows, emp_nonRnD):
+            day_hours = emp.optimized_hours.setdefault(d_str, {})
 
             # Fill in the final topic hours
-            for t_idx, t_name in enumerate(all_topics):
-                emp.optimized_hours[d_str][t_name] = optimized_hours[emp_i, d_i, t_idx]
+            day_hours.update(zip(all_topics, day_row))
 
             # Also store nonRnD hours
-            emp.optimized_hours[d_str]['nonRnD'] = optimized_hours[emp_i, d_i, -1]
+            day_hours['nonRnD'] = day_nonRnD
 
     # Build a results structure for direct return
     # Example: per-employee, per-day breakdown of each topic + nonRnD
+    #    Each day's dict is built by zipping the topic names with that day's row.
     allocations = {}
-    for emp_i, emp in enumerate(employees):
+    for emp, emp_rows, emp_nonRnD in zip(employees, hours_rows, nonRnD_rows):
         emp_alloc = {
             "name": emp.employee_name,
             "daily_allocations": {}
         }
-        for d_i, d_str in enumerate(date_list):
-            day_dict = {}
-            for t_idx, t_name in enumerate(all_topics):
-                day_dict[t_name] = optimized_hours[emp_i, d_i, t_idx]
-            day_dict["nonRnD"] = optimized_hours[emp_i, d_i, -1]
+        for d_str, day_row, day_nonRnD in zip(date_list, emp_rows, emp_nonRnD):
+            day_dict = dict(zip(all_topics, day_row))
+            day_dict["nonRnD"] = day_nonRnD
 
             emp_alloc["daily_allocations"][d_str] = day_dict
 